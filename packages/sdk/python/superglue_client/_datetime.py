@@ -0,0 +1,23 @@
+"""Contains the ISO 8601 timestamp parser used by the models
+
+The server sends ``datetime.isoformat()`` output, which ``datetime.fromisoformat`` handles far faster than dateutil.
+dateutil is only imported for timestamps the standard library rejects, so importing the models stays cheap.
+"""
+
+import datetime
+
+
+def parse_iso(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 timestamp, trying the stdlib parser before dateutil
+
+    fromisoformat only accepts a trailing "Z" from Python 3.11 on, so that is rewritten first.
+    """
+    try:
+        return datetime.datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        from dateutil.parser import isoparse
+
+        return isoparse(value)
+
+
+__all__ = ["parse_iso"]
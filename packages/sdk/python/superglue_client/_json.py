@@ -0,0 +1,30 @@
+"""Contains the JSON encoder and decoder used for request and response bodies
+
+Responses are parsed with ``orjson`` when it is installed (``pip install superglue-client[fast]``), otherwise with the
+standard library. Request bodies are always encoded with the standard library, so what a request accepts does not
+depend on which extras are installed.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+loads = orjson.loads if orjson is not None else json.loads
+
+# json.dumps builds a new JSONEncoder on every call when given non-default options
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize ``obj`` to compact UTF-8 JSON
+
+    Like ``json.dumps``, ``NaN`` and ``Infinity`` are written as-is rather than rejected.
+    """
+    return _encoder.encode(obj).encode("utf-8")
+
+
+__all__ = ["dumps", "loads"]
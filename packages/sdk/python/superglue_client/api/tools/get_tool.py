@@ -1,36 +1,41 @@
+from functools import lru_cache
 from http import HTTPStatus
 from typing import Any, Optional, Union
+from urllib.parse import quote
 
 import httpx
 
-from ... import errors
+from ... import _json, errors
 from ...client import AuthenticatedClient, Client
 from ...models.error import Error
 from ...models.tool import Tool
 from ...types import Response
 
 
+@lru_cache(maxsize=1024)
+def _url(tool_id: str) -> str:
+    return "/tools/{tool_id}".format(tool_id=quote(tool_id, safe=""))
+
+
 def _get_kwargs(
     tool_id: str,
 ) -> dict[str, Any]:
-    _kwargs: dict[str, Any] = {
+    return {
         "method": "get",
-        "url": f"/tools/{tool_id}",
+        "url": _url(tool_id),
     }
 
-    return _kwargs
-
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[Union[Error, Tool]]:
     if response.status_code == 200:
-        response_200 = Tool.from_dict(response.json())
+        response_200 = Tool.from_dict(_json.loads(response.content))
 
         return response_200
 
     if response.status_code == 404:
-        response_404 = Error.from_dict(response.json())
+        response_404 = Error.from_dict(_json.loads(response.content))
 
         return response_404
 
@@ -77,7 +82,12 @@ def sync_detailed(
         **kwargs,
     )
 
-    return _build_response(client=client, response=response)
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
 
 
 def sync(
@@ -98,10 +108,15 @@ def sync(
         Union[Error, Tool]
     """
 
-    return sync_detailed(
+    kwargs = _get_kwargs(
         tool_id=tool_id,
-        client=client,
-    ).parsed
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _parse_response(client=client, response=response)
 
 
 async def asyncio_detailed(
@@ -128,7 +143,12 @@ async def asyncio_detailed(
 
     response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
 
 
 async def asyncio(
@@ -149,9 +169,10 @@ async def asyncio(
         Union[Error, Tool]
     """
 
-    return (
-        await asyncio_detailed(
-            tool_id=tool_id,
-            client=client,
-        )
-    ).parsed
+    kwargs = _get_kwargs(
+        tool_id=tool_id,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _parse_response(client=client, response=response)
@@ -1,41 +1,61 @@
+from asyncio import AbstractEventLoop, Semaphore, Task, create_task, gather, get_running_loop, shield
+from collections import OrderedDict
+from collections.abc import Iterator
 from http import HTTPStatus
+from math import ceil
 from typing import Any, Optional, Union
+from weakref import WeakKeyDictionary
 
 import httpx
 
-from ... import errors
+from ... import _json, errors
 from ...client import AuthenticatedClient, Client
 from ...models.list_tools_response_200 import ListToolsResponse200
+from ...models.tool import Tool
 from ...types import UNSET, Response, Unset
 
+# Defaults for the page and limit query params, matching the server side defaults
+_DEFAULT_PAGE = 1
+_DEFAULT_LIMIT = 50
+
+# Requests currently in flight from asyncio_detailed per event loop, keyed by AsyncClient, url and query params.
+# Concurrent callers asking for the same page share one request instead of each sending their own. Tasks cannot be
+# awaited from another loop, so each loop only sees its own.
+_inflight: WeakKeyDictionary[AbstractEventLoop, dict[tuple[Any, ...], Task[httpx.Response]]] = WeakKeyDictionary()
+
+# Last ETag and raw body seen per httpx client for each url and query params. Used to send If-None-Match so that
+# polling an unchanged page gets an empty 304 response instead of the full body. The raw body is kept rather than the
+# parsed model so that every 304 hands out a fresh model that callers are free to modify. Only the most recently used
+# _ETAG_CACHE_SIZE pages are kept per client, so paging or filtering through many pages does not grow it without bound.
+_ETAG_CACHE_SIZE = 32
+_etags: WeakKeyDictionary[Any, OrderedDict[tuple[Any, ...], tuple[str, bytes]]] = WeakKeyDictionary()
+
 
 def _get_kwargs(
     *,
-    page: Union[Unset, int] = 1,
-    limit: Union[Unset, int] = 50,
+    page: Union[Unset, int] = _DEFAULT_PAGE,
+    limit: Union[Unset, int] = _DEFAULT_LIMIT,
 ) -> dict[str, Any]:
     params: dict[str, Any] = {}
 
-    params["page"] = page
-
-    params["limit"] = limit
+    if page is not UNSET and page is not None:
+        params["page"] = page
 
-    params = {k: v for k, v in params.items() if v is not UNSET and v is not None}
+    if limit is not UNSET and limit is not None:
+        params["limit"] = limit
 
-    _kwargs: dict[str, Any] = {
+    return {
         "method": "get",
         "url": "/tools",
         "params": params,
     }
 
-    return _kwargs
-
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[ListToolsResponse200]:
     if response.status_code == 200:
-        response_200 = ListToolsResponse200.from_dict(response.json())
+        response_200 = ListToolsResponse200.from_dict(_json.loads(response.content))
 
         return response_200
 
@@ -56,11 +76,61 @@ def _build_response(
     )
 
 
+def _cache_key(kwargs: dict[str, Any]) -> tuple[Any, ...]:
+    return (kwargs["url"], tuple(sorted(kwargs["params"].items())))
+
+
+def _add_if_none_match(
+    httpx_client: Union[httpx.Client, httpx.AsyncClient], key: tuple[Any, ...], kwargs: dict[str, Any]
+) -> None:
+    cached = _etags.get(httpx_client, {}).get(key)
+    if cached is not None:
+        kwargs["headers"] = {"If-None-Match": cached[0]}
+
+
+def _build_conditional_response(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    httpx_client: Union[httpx.Client, httpx.AsyncClient],
+    key: tuple[Any, ...],
+    response: httpx.Response,
+) -> Response[ListToolsResponse200]:
+    """Like _build_response, but parses a 304 from the cached body and remembers the ETag and body of a 200"""
+    cached_pages = _etags.setdefault(httpx_client, OrderedDict())
+    cached = cached_pages.get(key)
+
+    if (
+        response.status_code == 304
+        and cached is not None
+        and cached[0] == response.request.headers.get("If-None-Match")
+    ):
+        cached_pages.move_to_end(key)
+        return Response(
+            status_code=HTTPStatus.NOT_MODIFIED,
+            content=response.content,
+            headers=response.headers,
+            parsed=ListToolsResponse200.from_dict(_json.loads(cached[1])),
+        )
+
+    built = _build_response(client=client, response=response)
+
+    etag = response.headers.get("ETag")
+    if response.status_code == 200 and etag and built.parsed is not None:
+        cached_pages[key] = (etag, response.content)
+        cached_pages.move_to_end(key)
+        if len(cached_pages) > _ETAG_CACHE_SIZE:
+            cached_pages.popitem(last=False)
+    else:
+        cached_pages.pop(key, None)
+
+    return built
+
+
 def sync_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
-    page: Union[Unset, int] = 1,
-    limit: Union[Unset, int] = 50,
+    page: Union[Unset, int] = _DEFAULT_PAGE,
+    limit: Union[Unset, int] = _DEFAULT_LIMIT,
 ) -> Response[ListToolsResponse200]:
     """List tools
 
@@ -81,18 +151,22 @@ def sync_detailed(
         limit=limit,
     )
 
-    response = client.get_httpx_client().request(
+    httpx_client = client.get_httpx_client()
+    key = _cache_key(kwargs)
+    _add_if_none_match(httpx_client, key, kwargs)
+
+    response = httpx_client.request(
         **kwargs,
     )
 
-    return _build_response(client=client, response=response)
+    return _build_conditional_response(client=client, httpx_client=httpx_client, key=key, response=response)
 
 
 def sync(
     *,
     client: Union[AuthenticatedClient, Client],
-    page: Union[Unset, int] = 1,
-    limit: Union[Unset, int] = 50,
+    page: Union[Unset, int] = _DEFAULT_PAGE,
+    limit: Union[Unset, int] = _DEFAULT_LIMIT,
 ) -> Optional[ListToolsResponse200]:
     """List tools
 
@@ -118,8 +192,8 @@ def sync(
 async def asyncio_detailed(
     *,
     client: Union[AuthenticatedClient, Client],
-    page: Union[Unset, int] = 1,
-    limit: Union[Unset, int] = 50,
+    page: Union[Unset, int] = _DEFAULT_PAGE,
+    limit: Union[Unset, int] = _DEFAULT_LIMIT,
 ) -> Response[ListToolsResponse200]:
     """List tools
 
@@ -140,16 +214,28 @@ async def asyncio_detailed(
         limit=limit,
     )
 
-    response = await client.get_async_httpx_client().request(**kwargs)
+    httpx_client = client.get_async_httpx_client()
+    key = _cache_key(kwargs)
+    inflight_key = (httpx_client, *key)
+    inflight = _inflight.setdefault(get_running_loop(), {})
+    request = inflight.get(inflight_key)
+    if request is None:
+        _add_if_none_match(httpx_client, key, kwargs)
+        request = create_task(httpx_client.request(**kwargs))
+        inflight[inflight_key] = request
+        request.add_done_callback(lambda _: inflight.pop(inflight_key, None))
+
+    # shield so that cancelling one caller does not cancel the request shared with the others
+    response = await shield(request)
 
-    return _build_response(client=client, response=response)
+    return _build_conditional_response(client=client, httpx_client=httpx_client, key=key, response=response)
 
 
 async def asyncio(
     *,
     client: Union[AuthenticatedClient, Client],
-    page: Union[Unset, int] = 1,
-    limit: Union[Unset, int] = 50,
+    page: Union[Unset, int] = _DEFAULT_PAGE,
+    limit: Union[Unset, int] = _DEFAULT_LIMIT,
 ) -> Optional[ListToolsResponse200]:
     """List tools
 
@@ -172,3 +258,102 @@ async def asyncio(
             limit=limit,
         )
     ).parsed
+
+
+def sync_iter(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    limit: int = _DEFAULT_LIMIT,
+) -> Iterator[Tool]:
+    """Iterate over all tools
+
+    Requests one page at a time and yields its tools before fetching the next, so callers can process tools as they
+    arrive instead of collecting every page first. Prefer this over a single large ``limit`` when listing many tools.
+
+    Args:
+        limit (int): Page size. Default: 50.
+
+    Raises:
+        errors.UnexpectedStatus: If any page is not returned with a 200 status code.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        Iterator[Tool]
+    """
+
+    # Pages are requested without the ETag cache, which would otherwise keep the body of every page alive
+    httpx_client = client.get_httpx_client()
+    page = 1
+    while True:
+        response = _build_response(client=client, response=httpx_client.request(**_get_kwargs(page=page, limit=limit)))
+        if response.parsed is None:
+            raise errors.UnexpectedStatus(response.status_code, response.content)
+        yield from response.parsed.data or []
+        if not response.parsed.has_more:
+            return
+        page += 1
+
+
+async def asyncio_all(
+    *,
+    client: Union[AuthenticatedClient, Client],
+    limit: int = _DEFAULT_LIMIT,
+    max_concurrency: int = 10,
+) -> list[Tool]:
+    """List all tools
+
+    Fetches the first page, then requests the remaining pages concurrently, using the page count derived from
+    ``total`` and the page size the server reports back in ``limit``. If the server does not report ``total``, or the
+    pages turn out smaller than reported, the rest is fetched by following ``has_more`` one page after another.
+
+    Args:
+        limit (int): Page size to request. The server may return smaller pages. Default: 50.
+        max_concurrency (int): Maximum number of pages requested at the same time. Default: 10.
+
+    Raises:
+        ValueError: If ``limit`` or ``max_concurrency`` is less than 1.
+        errors.UnexpectedStatus: If any page is not returned with a 200 status code.
+        httpx.TimeoutException: If the request takes longer than Client.timeout.
+
+    Returns:
+        list[Tool]
+    """
+
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+    # Like sync_iter, pages skip the ETag cache, which would otherwise keep the body of every page alive
+    httpx_client = client.get_async_httpx_client()
+    semaphore = Semaphore(max_concurrency)
+
+    async def fetch_page(page: int) -> ListToolsResponse200:
+        async with semaphore:
+            response = _build_response(
+                client=client, response=await httpx_client.request(**_get_kwargs(page=page, limit=limit))
+            )
+        if response.parsed is None:
+            raise errors.UnexpectedStatus(response.status_code, response.content)
+        return response.parsed
+
+    first = await fetch_page(1)
+    tools = list(first.data or [])
+    page, result = 1, first
+
+    # The server clamps limit to its own maximum, so count pages by the size it actually used
+    page_size = first.limit if first.limit is not UNSET and first.limit > 0 else limit
+    if first.total is not UNSET:
+        last_page = ceil(first.total / page_size)
+        if last_page > 1:
+            results = await gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+            for result in results:
+                tools.extend(result.data or [])
+            page = last_page
+
+    while result.has_more:
+        page += 1
+        result = await fetch_page(page)
+        tools.extend(result.data or [])
+
+    return tools
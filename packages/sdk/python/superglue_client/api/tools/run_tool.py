@@ -1,9 +1,11 @@
+from functools import lru_cache
 from http import HTTPStatus
 from typing import Any, Optional, Union
+from urllib.parse import quote
 
 import httpx
 
-from ... import errors
+from ... import _json, errors
 from ...client import AuthenticatedClient, Client
 from ...models.error import Error
 from ...models.run import Run
@@ -11,56 +13,54 @@ from ...models.run_request import RunRequest
 from ...types import Response
 
 
+@lru_cache(maxsize=1024)
+def _url(tool_id: str) -> str:
+    return "/tools/{tool_id}/run".format(tool_id=quote(tool_id, safe=""))
+
+
 def _get_kwargs(
     tool_id: str,
     *,
     body: RunRequest,
 ) -> dict[str, Any]:
-    headers: dict[str, Any] = {}
-
-    _kwargs: dict[str, Any] = {
+    return {
         "method": "post",
-        "url": f"/tools/{tool_id}/run",
+        "url": _url(tool_id),
+        "content": _json.dumps(body.to_dict()),
+        "headers": {"Content-Type": "application/json"},
     }
 
-    _kwargs["json"] = body.to_dict()
-
-    headers["Content-Type"] = "application/json"
-
-    _kwargs["headers"] = headers
-    return _kwargs
-
 
 def _parse_response(
     *, client: Union[AuthenticatedClient, Client], response: httpx.Response
 ) -> Optional[Union[Error, Run]]:
     if response.status_code == 200:
-        response_200 = Run.from_dict(response.json())
+        response_200 = Run.from_dict(_json.loads(response.content))
 
         return response_200
 
     if response.status_code == 202:
-        response_202 = Run.from_dict(response.json())
+        response_202 = Run.from_dict(_json.loads(response.content))
 
         return response_202
 
     if response.status_code == 400:
-        response_400 = Error.from_dict(response.json())
+        response_400 = Error.from_dict(_json.loads(response.content))
 
         return response_400
 
     if response.status_code == 409:
-        response_409 = Error.from_dict(response.json())
+        response_409 = Error.from_dict(_json.loads(response.content))
 
         return response_409
 
     if response.status_code == 410:
-        response_410 = Error.from_dict(response.json())
+        response_410 = Error.from_dict(_json.loads(response.content))
 
         return response_410
 
     if response.status_code == 429:
-        response_429 = Error.from_dict(response.json())
+        response_429 = Error.from_dict(_json.loads(response.content))
 
         return response_429
 
@@ -110,7 +110,12 @@ def sync_detailed(
         **kwargs,
     )
 
-    return _build_response(client=client, response=response)
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
 
 
 def sync(
@@ -133,11 +138,16 @@ def sync(
         Union[Error, Run]
     """
 
-    return sync_detailed(
+    kwargs = _get_kwargs(
         tool_id=tool_id,
-        client=client,
         body=body,
-    ).parsed
+    )
+
+    response = client.get_httpx_client().request(
+        **kwargs,
+    )
+
+    return _parse_response(client=client, response=response)
 
 
 async def asyncio_detailed(
@@ -167,7 +177,12 @@ async def asyncio_detailed(
 
     response = await client.get_async_httpx_client().request(**kwargs)
 
-    return _build_response(client=client, response=response)
+    return Response(
+        status_code=HTTPStatus(response.status_code),
+        content=response.content,
+        headers=response.headers,
+        parsed=_parse_response(client=client, response=response),
+    )
 
 
 async def asyncio(
@@ -190,10 +205,11 @@ async def asyncio(
         Union[Error, Run]
     """
 
-    return (
-        await asyncio_detailed(
-            tool_id=tool_id,
-            client=client,
-            body=body,
-        )
-    ).parsed
+    kwargs = _get_kwargs(
+        tool_id=tool_id,
+        body=body,
+    )
+
+    response = await client.get_async_httpx_client().request(**kwargs)
+
+    return _parse_response(client=client, response=response)
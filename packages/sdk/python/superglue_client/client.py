@@ -1,9 +1,38 @@
 import ssl
+from importlib.util import find_spec
 from typing import Any, Optional, Union
 
 import httpx
 from attrs import define, evolve, field
 
+DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=64, max_connections=128)
+"""Connection pool limits used unless ``limits`` or ``transport`` is passed in ``httpx_args``"""
+
+DEFAULT_RETRIES = 3
+"""How often a failed connection attempt is retried. Requests that reached the server are never retried."""
+
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+def _pool_args(
+    verify_ssl: Union[str, bool, ssl.SSLContext],
+    httpx_args: dict[str, Any],
+    transport_class: Union[type[httpx.HTTPTransport], type[httpx.AsyncHTTPTransport]],
+) -> dict[str, Any]:
+    """Connection pool arguments for a new httpx client, overridden by anything set in ``httpx_args``"""
+    args = {"limits": DEFAULT_LIMITS, "http2": _HTTP2_AVAILABLE, **httpx_args}
+    if "transport" not in args:
+        args["transport"] = transport_class(
+            verify=verify_ssl,
+            cert=args.get("cert"),
+            trust_env=args.get("trust_env", True),
+            http1=args.get("http1", True),
+            http2=args["http2"],
+            limits=args["limits"],
+            retries=DEFAULT_RETRIES,
+        )
+    return args
+
 
 @define
 class Client:
@@ -26,6 +55,8 @@ class Client:
         ``follow_redirects``: Whether or not to follow redirects. Default value is False.
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
+        Unless overridden here with ``limits``, ``http2`` or ``transport``, clients keep up to 64 idle keep-alive
+        connections, use HTTP/2 when ``h2`` is installed and retry failed connection attempts.
 
 
     Attributes:
@@ -87,7 +118,7 @@ class Client:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_pool_args(self._verify_ssl, self._httpx_args, httpx.HTTPTransport),
             )
         return self._client
 
@@ -118,7 +149,7 @@ class Client:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_pool_args(self._verify_ssl, self._httpx_args, httpx.AsyncHTTPTransport),
             )
         return self._async_client
 
@@ -153,6 +184,8 @@ class AuthenticatedClient:
         ``follow_redirects``: Whether or not to follow redirects. Default value is False.
 
         ``httpx_args``: A dictionary of additional arguments to be passed to the ``httpx.Client`` and ``httpx.AsyncClient`` constructor.
+        Unless overridden here with ``limits``, ``http2`` or ``transport``, clients keep up to 64 idle keep-alive
+        connections, use HTTP/2 when ``h2`` is installed and retry failed connection attempts.
 
 
     Attributes:
@@ -222,7 +255,7 @@ class AuthenticatedClient:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_pool_args(self._verify_ssl, self._httpx_args, httpx.HTTPTransport),
             )
         return self._client
 
@@ -254,7 +287,7 @@ class AuthenticatedClient:
                 timeout=self._timeout,
                 verify=self._verify_ssl,
                 follow_redirects=self._follow_redirects,
-                **self._httpx_args,
+                **_pool_args(self._verify_ssl, self._httpx_args, httpx.AsyncHTTPTransport),
             )
         return self._async_client
 
@@ -1,51 +1,44 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import Any, TypeVar
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
-if TYPE_CHECKING:
-    from ..models.error_error import ErrorError
-
+from ..models.error_error import ErrorError
 
 T = TypeVar("T", bound="Error")
 
+_KNOWN_KEYS = frozenset(("error",))
+
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class Error:
     """
     Attributes:
         error (ErrorError):
     """
 
-    error: "ErrorError"
+    error: ErrorError
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        error = self.error.to_dict()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "error": error,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "error": self.error.to_dict(),
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.error_error import ErrorError
-
-        d = dict(src_dict)
-        error = ErrorError.from_dict(d.pop("error"))
+        error = ErrorError.from_dict(src_dict["error"])
 
         error = cls(
             error=error,
         )
 
-        error.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            error.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return error
 
     @property
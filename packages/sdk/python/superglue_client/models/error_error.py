@@ -6,8 +6,10 @@ from attrs import field as _attrs_field
 
 T = TypeVar("T", bound="ErrorError")
 
+_KNOWN_KEYS = frozenset(("message",))
 
-@_attrs_define
+
+@_attrs_define(slots=True, weakref_slot=False)
 class ErrorError:
     """
     Attributes:
@@ -18,28 +20,23 @@ class ErrorError:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        message = self.message
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "message": message,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "message": self.message,
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        message = d.pop("message")
+        message = src_dict["message"]
 
         error_error = cls(
             message=message,
         )
 
-        error_error.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            error_error.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return error_error
 
     @property
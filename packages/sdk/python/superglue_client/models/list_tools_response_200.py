@@ -1,19 +1,18 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.tool import Tool
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.tool import Tool
-
-
 T = TypeVar("T", bound="ListToolsResponse200")
 
+_KNOWN_KEYS = frozenset(("data", "page", "limit", "total", "hasMore"))
+
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class ListToolsResponse200:
     """
     Attributes:
@@ -24,7 +23,7 @@ class ListToolsResponse200:
         has_more (Union[Unset, bool]):  Example: True.
     """
 
-    data: Union[Unset, list["Tool"]] = UNSET
+    data: Union[Unset, list[Tool]] = UNSET
     page: Union[Unset, int] = UNSET
     limit: Union[Unset, int] = UNSET
     total: Union[Unset, int] = UNSET
@@ -32,56 +31,32 @@ class ListToolsResponse200:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        data: Union[Unset, list[dict[str, Any]]] = UNSET
-        if not isinstance(self.data, Unset):
-            data = []
-            for data_item_data in self.data:
-                data_item = data_item_data.to_dict()
-                data.append(data_item)
-
-        page = self.page
-
-        limit = self.limit
-
-        total = self.total
-
-        has_more = self.has_more
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if data is not UNSET:
-            field_dict["data"] = data
-        if page is not UNSET:
-            field_dict["page"] = page
-        if limit is not UNSET:
-            field_dict["limit"] = limit
-        if total is not UNSET:
-            field_dict["total"] = total
-        if has_more is not UNSET:
-            field_dict["hasMore"] = has_more
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
+        if self.data is not UNSET:
+            field_dict["data"] = [data_item.to_dict() for data_item in self.data]
+        if self.page is not UNSET:
+            field_dict["page"] = self.page
+        if self.limit is not UNSET:
+            field_dict["limit"] = self.limit
+        if self.total is not UNSET:
+            field_dict["total"] = self.total
+        if self.has_more is not UNSET:
+            field_dict["hasMore"] = self.has_more
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.tool import Tool
-
-        d = dict(src_dict)
-        data = []
-        _data = d.pop("data", UNSET)
-        for data_item_data in _data or []:
-            data_item = Tool.from_dict(data_item_data)
-
-            data.append(data_item)
+        _data = src_dict.get("data")
+        data = list(map(Tool.from_dict, _data)) if _data else []
 
-        page = d.pop("page", UNSET)
+        page = src_dict.get("page", UNSET)
 
-        limit = d.pop("limit", UNSET)
+        limit = src_dict.get("limit", UNSET)
 
-        total = d.pop("total", UNSET)
+        total = src_dict.get("total", UNSET)
 
-        has_more = d.pop("hasMore", UNSET)
+        has_more = src_dict.get("hasMore", UNSET)
 
         list_tools_response_200 = cls(
             data=data,
@@ -91,7 +66,8 @@ class ListToolsResponse200:
             has_more=has_more,
         )
 
-        list_tools_response_200.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            list_tools_response_200.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return list_tools_response_200
 
     @property
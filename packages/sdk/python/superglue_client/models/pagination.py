@@ -4,13 +4,16 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.pagination_type import BY_VALUE as TYPE_BY_VALUE
 from ..models.pagination_type import PaginationType
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="Pagination")
 
+_KNOWN_KEYS = frozenset(("type", "pageSize", "cursorPath", "stopCondition"))
 
-@_attrs_define
+
+@_attrs_define(slots=True, weakref_slot=False)
 class Pagination:
     """Pagination configuration (HTTP/HTTPS only, not applicable to Postgres/FTP)
 
@@ -35,40 +38,29 @@ class Pagination:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        type_ = self.type_.value
-
-        page_size = self.page_size
-
-        cursor_path = self.cursor_path
-
-        stop_condition = self.stop_condition
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type_,
-            }
-        )
-        if page_size is not UNSET:
-            field_dict["pageSize"] = page_size
-        if cursor_path is not UNSET:
-            field_dict["cursorPath"] = cursor_path
-        if stop_condition is not UNSET:
-            field_dict["stopCondition"] = stop_condition
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "type": self.type_._value_,
+        }
+        if self.page_size is not UNSET:
+            field_dict["pageSize"] = self.page_size
+        if self.cursor_path is not UNSET:
+            field_dict["cursorPath"] = self.cursor_path
+        if self.stop_condition is not UNSET:
+            field_dict["stopCondition"] = self.stop_condition
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        type_ = PaginationType(d.pop("type"))
+        _type_ = src_dict["type"]
+        type_ = (isinstance(_type_, str) and TYPE_BY_VALUE.get(_type_)) or PaginationType(_type_)
 
-        page_size = d.pop("pageSize", UNSET)
+        page_size = src_dict.get("pageSize", UNSET)
 
-        cursor_path = d.pop("cursorPath", UNSET)
+        cursor_path = src_dict.get("cursorPath", UNSET)
 
-        stop_condition = d.pop("stopCondition", UNSET)
+        stop_condition = src_dict.get("stopCondition", UNSET)
 
         pagination = cls(
             type_=type_,
@@ -77,7 +69,8 @@ class Pagination:
             stop_condition=stop_condition,
         )
 
-        pagination.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            pagination.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return pagination
 
     @property
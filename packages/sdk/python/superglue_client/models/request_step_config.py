@@ -1,23 +1,24 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.pagination import Pagination
+from ..models.request_step_config_headers import RequestStepConfigHeaders
+from ..models.request_step_config_method import BY_VALUE as METHOD_BY_VALUE
 from ..models.request_step_config_method import RequestStepConfigMethod
+from ..models.request_step_config_query_params import RequestStepConfigQueryParams
+from ..models.request_step_config_type import BY_VALUE as TYPE_BY_VALUE
 from ..models.request_step_config_type import RequestStepConfigType
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.pagination import Pagination
-    from ..models.request_step_config_headers import RequestStepConfigHeaders
-    from ..models.request_step_config_query_params import RequestStepConfigQueryParams
-
-
 T = TypeVar("T", bound="RequestStepConfig")
 
+_KNOWN_KEYS = frozenset(("url", "method", "type", "queryParams", "headers", "body", "pagination", "systemId"))
+
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class RequestStepConfig:
     """Configuration for a request step. Protocol is detected from URL scheme:
     - HTTP/HTTPS: Standard REST API calls with query params, headers, body
@@ -63,103 +64,60 @@ class RequestStepConfig:
     url: str
     method: RequestStepConfigMethod
     type_: Union[Unset, RequestStepConfigType] = UNSET
-    query_params: Union[Unset, "RequestStepConfigQueryParams"] = UNSET
-    headers: Union[Unset, "RequestStepConfigHeaders"] = UNSET
+    query_params: Union[Unset, RequestStepConfigQueryParams] = UNSET
+    headers: Union[Unset, RequestStepConfigHeaders] = UNSET
     body: Union[Unset, str] = UNSET
-    pagination: Union[Unset, "Pagination"] = UNSET
+    pagination: Union[Unset, Pagination] = UNSET
     system_id: Union[Unset, str] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        url = self.url
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "url": self.url,
+            "method": self.method._value_,
+        }
+        if self.type_ is not UNSET:
+            field_dict["type"] = self.type_._value_
+        if self.query_params is not UNSET:
+            field_dict["queryParams"] = self.query_params.to_dict()
+        if self.headers is not UNSET:
+            field_dict["headers"] = self.headers.to_dict()
+        if self.body is not UNSET:
+            field_dict["body"] = self.body
+        if self.pagination is not UNSET:
+            field_dict["pagination"] = self.pagination.to_dict()
+        if self.system_id is not UNSET:
+            field_dict["systemId"] = self.system_id
 
-        method = self.method.value
-
-        type_: Union[Unset, str] = UNSET
-        if not isinstance(self.type_, Unset):
-            type_ = self.type_.value
+        return field_dict
 
-        query_params: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.query_params, Unset):
-            query_params = self.query_params.to_dict()
+    @classmethod
+    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
+        url = src_dict["url"]
 
-        headers: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.headers, Unset):
-            headers = self.headers.to_dict()
+        _method = src_dict["method"]
+        method = (isinstance(_method, str) and METHOD_BY_VALUE.get(_method)) or RequestStepConfigMethod(_method)
 
-        body = self.body
+        _type_ = src_dict.get("type", UNSET)
+        type_ = (
+            UNSET
+            if _type_ is UNSET
+            else (isinstance(_type_, str) and TYPE_BY_VALUE.get(_type_)) or RequestStepConfigType(_type_)
+        )
 
-        pagination: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.pagination, Unset):
-            pagination = self.pagination.to_dict()
+        _query_params = src_dict.get("queryParams", UNSET)
+        query_params = UNSET if _query_params is UNSET else RequestStepConfigQueryParams.from_dict(_query_params)
 
-        system_id = self.system_id
+        _headers = src_dict.get("headers", UNSET)
+        headers = UNSET if _headers is UNSET else RequestStepConfigHeaders.from_dict(_headers)
 
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "url": url,
-                "method": method,
-            }
-        )
-        if type_ is not UNSET:
-            field_dict["type"] = type_
-        if query_params is not UNSET:
-            field_dict["queryParams"] = query_params
-        if headers is not UNSET:
-            field_dict["headers"] = headers
-        if body is not UNSET:
-            field_dict["body"] = body
-        if pagination is not UNSET:
-            field_dict["pagination"] = pagination
-        if system_id is not UNSET:
-            field_dict["systemId"] = system_id
+        body = src_dict.get("body", UNSET)
 
-        return field_dict
+        _pagination = src_dict.get("pagination", UNSET)
+        pagination = UNSET if _pagination is UNSET else Pagination.from_dict(_pagination)
 
-    @classmethod
-    def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.pagination import Pagination
-        from ..models.request_step_config_headers import RequestStepConfigHeaders
-        from ..models.request_step_config_query_params import RequestStepConfigQueryParams
-
-        d = dict(src_dict)
-        url = d.pop("url")
-
-        method = RequestStepConfigMethod(d.pop("method"))
-
-        _type_ = d.pop("type", UNSET)
-        type_: Union[Unset, RequestStepConfigType]
-        if isinstance(_type_, Unset):
-            type_ = UNSET
-        else:
-            type_ = RequestStepConfigType(_type_)
-
-        _query_params = d.pop("queryParams", UNSET)
-        query_params: Union[Unset, RequestStepConfigQueryParams]
-        if isinstance(_query_params, Unset):
-            query_params = UNSET
-        else:
-            query_params = RequestStepConfigQueryParams.from_dict(_query_params)
-
-        _headers = d.pop("headers", UNSET)
-        headers: Union[Unset, RequestStepConfigHeaders]
-        if isinstance(_headers, Unset):
-            headers = UNSET
-        else:
-            headers = RequestStepConfigHeaders.from_dict(_headers)
-
-        body = d.pop("body", UNSET)
-
-        _pagination = d.pop("pagination", UNSET)
-        pagination: Union[Unset, Pagination]
-        if isinstance(_pagination, Unset):
-            pagination = UNSET
-        else:
-            pagination = Pagination.from_dict(_pagination)
-
-        system_id = d.pop("systemId", UNSET)
+        system_id = src_dict.get("systemId", UNSET)
 
         request_step_config = cls(
             url=url,
@@ -172,7 +130,8 @@ class RequestStepConfig:
             system_id=system_id,
         )
 
-        request_step_config.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            request_step_config.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return request_step_config
 
     @property
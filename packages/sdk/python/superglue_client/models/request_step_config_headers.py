@@ -7,7 +7,7 @@ from attrs import field as _attrs_field
 T = TypeVar("T", bound="RequestStepConfigHeaders")
 
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class RequestStepConfigHeaders:
     """HTTP headers (HTTP only). Supports template expressions with <<(sourceData) => ...>> syntax.
 
@@ -20,17 +20,15 @@ class RequestStepConfigHeaders:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
         request_step_config_headers = cls()
 
-        request_step_config_headers.additional_properties = d
+        request_step_config_headers.additional_properties = dict(src_dict)
         return request_step_config_headers
 
     @property
@@ -1,7 +1,9 @@
-from enum import Enum
+from typing import Optional
 
+from ..types import StrEnum
 
-class RequestStepConfigMethod(str, Enum):
+
+class RequestStepConfigMethod(StrEnum):
     DELETE = "DELETE"
     GET = "GET"
     HEAD = "HEAD"
@@ -10,5 +12,11 @@ class RequestStepConfigMethod(str, Enum):
     POST = "POST"
     PUT = "PUT"
 
-    def __str__(self) -> str:
-        return str(self.value)
+    @classmethod
+    def try_parse(cls, value: str) -> Optional["RequestStepConfigMethod"]:
+        """Return the member with the given value, or None if there is none"""
+        return BY_VALUE.get(value) if isinstance(value, str) else None
+
+
+# Members keyed by value, so parsing is a dict lookup rather than a call through the enum metaclass
+BY_VALUE: dict[str, RequestStepConfigMethod] = {member.value: member for member in RequestStepConfigMethod}
@@ -4,15 +4,20 @@ from typing import Any, TypeVar, Union
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.response_filter_action import BY_VALUE as ACTION_BY_VALUE
 from ..models.response_filter_action import ResponseFilterAction
+from ..models.response_filter_scope import BY_VALUE as SCOPE_BY_VALUE
 from ..models.response_filter_scope import ResponseFilterScope
+from ..models.response_filter_target import BY_VALUE as TARGET_BY_VALUE
 from ..models.response_filter_target import ResponseFilterTarget
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="ResponseFilter")
 
+_KNOWN_KEYS = frozenset(("id", "enabled", "target", "pattern", "action", "name", "maskValue", "scope"))
 
-@_attrs_define
+
+@_attrs_define(slots=True, weakref_slot=False)
 class ResponseFilter:
     """Filter configuration for response data
 
@@ -38,67 +43,47 @@ class ResponseFilter:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        id = self.id
-
-        enabled = self.enabled
-
-        target = self.target.value
-
-        pattern = self.pattern
-
-        action = self.action.value
-
-        name = self.name
-
-        mask_value = self.mask_value
-
-        scope: Union[Unset, str] = UNSET
-        if not isinstance(self.scope, Unset):
-            scope = self.scope.value
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "enabled": enabled,
-                "target": target,
-                "pattern": pattern,
-                "action": action,
-            }
-        )
-        if name is not UNSET:
-            field_dict["name"] = name
-        if mask_value is not UNSET:
-            field_dict["maskValue"] = mask_value
-        if scope is not UNSET:
-            field_dict["scope"] = scope
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "id": self.id,
+            "enabled": self.enabled,
+            "target": self.target._value_,
+            "pattern": self.pattern,
+            "action": self.action._value_,
+        }
+        if self.name is not UNSET:
+            field_dict["name"] = self.name
+        if self.mask_value is not UNSET:
+            field_dict["maskValue"] = self.mask_value
+        if self.scope is not UNSET:
+            field_dict["scope"] = self.scope._value_
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        id = d.pop("id")
+        id = src_dict["id"]
 
-        enabled = d.pop("enabled")
+        enabled = src_dict["enabled"]
 
-        target = ResponseFilterTarget(d.pop("target"))
+        _target = src_dict["target"]
+        target = (isinstance(_target, str) and TARGET_BY_VALUE.get(_target)) or ResponseFilterTarget(_target)
 
-        pattern = d.pop("pattern")
+        pattern = src_dict["pattern"]
 
-        action = ResponseFilterAction(d.pop("action"))
+        _action = src_dict["action"]
+        action = (isinstance(_action, str) and ACTION_BY_VALUE.get(_action)) or ResponseFilterAction(_action)
 
-        name = d.pop("name", UNSET)
+        name = src_dict.get("name", UNSET)
 
-        mask_value = d.pop("maskValue", UNSET)
+        mask_value = src_dict.get("maskValue", UNSET)
 
-        _scope = d.pop("scope", UNSET)
-        scope: Union[Unset, ResponseFilterScope]
-        if isinstance(_scope, Unset):
-            scope = UNSET
-        else:
-            scope = ResponseFilterScope(_scope)
+        _scope = src_dict.get("scope", UNSET)
+        scope = (
+            UNSET
+            if _scope is UNSET
+            else (isinstance(_scope, str) and SCOPE_BY_VALUE.get(_scope)) or ResponseFilterScope(_scope)
+        )
 
         response_filter = cls(
             id=id,
@@ -111,7 +96,8 @@ class ResponseFilter:
             scope=scope,
         )
 
-        response_filter.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            response_filter.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return response_filter
 
     @property
@@ -1,25 +1,40 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.run_data import RunData
+from ..models.run_metadata import RunMetadata
+from ..models.run_options import RunOptions
+from ..models.run_status import BY_VALUE as STATUS_BY_VALUE
 from ..models.run_status import RunStatus
+from ..models.run_step_results_item import RunStepResultsItem
+from ..models.run_tool_payload import RunToolPayload
+from ..models.tool import Tool
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.run_data import RunData
-    from ..models.run_metadata import RunMetadata
-    from ..models.run_options import RunOptions
-    from ..models.run_step_results_item import RunStepResultsItem
-    from ..models.run_tool_payload import RunToolPayload
-    from ..models.tool import Tool
-
-
 T = TypeVar("T", bound="Run")
 
-
-@_attrs_define
+_KNOWN_KEYS = frozenset(
+    (
+        "runId",
+        "toolId",
+        "status",
+        "metadata",
+        "tool",
+        "toolPayload",
+        "data",
+        "error",
+        "stepResults",
+        "options",
+        "requestSource",
+        "traceId",
+    )
+)
+
+
+@_attrs_define(slots=True, weakref_slot=False)
 class Run:
     """
     Attributes:
@@ -48,142 +63,75 @@ class Run:
     run_id: str
     tool_id: str
     status: RunStatus
-    metadata: "RunMetadata"
-    tool: Union[Unset, "Tool"] = UNSET
-    tool_payload: Union[Unset, "RunToolPayload"] = UNSET
-    data: Union[Unset, "RunData"] = UNSET
+    metadata: RunMetadata
+    tool: Union[Unset, Tool] = UNSET
+    tool_payload: Union[Unset, RunToolPayload] = UNSET
+    data: Union[Unset, RunData] = UNSET
     error: Union[Unset, str] = UNSET
-    step_results: Union[Unset, list["RunStepResultsItem"]] = UNSET
-    options: Union[Unset, "RunOptions"] = UNSET
+    step_results: Union[Unset, list[RunStepResultsItem]] = UNSET
+    options: Union[Unset, RunOptions] = UNSET
     request_source: Union[Unset, str] = UNSET
     trace_id: Union[Unset, str] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        run_id = self.run_id
-
-        tool_id = self.tool_id
-
-        status = self.status.value
-
-        metadata = self.metadata.to_dict()
-
-        tool: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.tool, Unset):
-            tool = self.tool.to_dict()
-
-        tool_payload: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.tool_payload, Unset):
-            tool_payload = self.tool_payload.to_dict()
-
-        data: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.data, Unset):
-            data = self.data.to_dict()
-
-        error = self.error
-
-        step_results: Union[Unset, list[dict[str, Any]]] = UNSET
-        if not isinstance(self.step_results, Unset):
-            step_results = []
-            for step_results_item_data in self.step_results:
-                step_results_item = step_results_item_data.to_dict()
-                step_results.append(step_results_item)
-
-        options: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.options, Unset):
-            options = self.options.to_dict()
-
-        request_source = self.request_source
-
-        trace_id = self.trace_id
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "runId": run_id,
-                "toolId": tool_id,
-                "status": status,
-                "metadata": metadata,
-            }
-        )
-        if tool is not UNSET:
-            field_dict["tool"] = tool
-        if tool_payload is not UNSET:
-            field_dict["toolPayload"] = tool_payload
-        if data is not UNSET:
-            field_dict["data"] = data
-        if error is not UNSET:
-            field_dict["error"] = error
-        if step_results is not UNSET:
-            field_dict["stepResults"] = step_results
-        if options is not UNSET:
-            field_dict["options"] = options
-        if request_source is not UNSET:
-            field_dict["requestSource"] = request_source
-        if trace_id is not UNSET:
-            field_dict["traceId"] = trace_id
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "runId": self.run_id,
+            "toolId": self.tool_id,
+            "status": self.status._value_,
+            "metadata": self.metadata.to_dict(),
+        }
+        if self.tool is not UNSET:
+            field_dict["tool"] = self.tool.to_dict()
+        if self.tool_payload is not UNSET:
+            field_dict["toolPayload"] = self.tool_payload.to_dict()
+        if self.data is not UNSET:
+            field_dict["data"] = self.data.to_dict()
+        if self.error is not UNSET:
+            field_dict["error"] = self.error
+        if self.step_results is not UNSET:
+            field_dict["stepResults"] = [step_results_item.to_dict() for step_results_item in self.step_results]
+        if self.options is not UNSET:
+            field_dict["options"] = self.options.to_dict()
+        if self.request_source is not UNSET:
+            field_dict["requestSource"] = self.request_source
+        if self.trace_id is not UNSET:
+            field_dict["traceId"] = self.trace_id
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.run_data import RunData
-        from ..models.run_metadata import RunMetadata
-        from ..models.run_options import RunOptions
-        from ..models.run_step_results_item import RunStepResultsItem
-        from ..models.run_tool_payload import RunToolPayload
-        from ..models.tool import Tool
-
-        d = dict(src_dict)
-        run_id = d.pop("runId")
-
-        tool_id = d.pop("toolId")
+        run_id = src_dict["runId"]
 
-        status = RunStatus(d.pop("status"))
+        tool_id = src_dict["toolId"]
 
-        metadata = RunMetadata.from_dict(d.pop("metadata"))
+        _status = src_dict["status"]
+        status = (isinstance(_status, str) and STATUS_BY_VALUE.get(_status)) or RunStatus(_status)
 
-        _tool = d.pop("tool", UNSET)
-        tool: Union[Unset, Tool]
-        if isinstance(_tool, Unset):
-            tool = UNSET
-        else:
-            tool = Tool.from_dict(_tool)
+        metadata = RunMetadata.from_dict(src_dict["metadata"])
 
-        _tool_payload = d.pop("toolPayload", UNSET)
-        tool_payload: Union[Unset, RunToolPayload]
-        if isinstance(_tool_payload, Unset):
-            tool_payload = UNSET
-        else:
-            tool_payload = RunToolPayload.from_dict(_tool_payload)
+        _tool = src_dict.get("tool", UNSET)
+        tool = UNSET if _tool is UNSET else Tool.from_dict(_tool)
 
-        _data = d.pop("data", UNSET)
-        data: Union[Unset, RunData]
-        if isinstance(_data, Unset):
-            data = UNSET
-        else:
-            data = RunData.from_dict(_data)
+        _tool_payload = src_dict.get("toolPayload", UNSET)
+        tool_payload = UNSET if _tool_payload is UNSET else RunToolPayload.from_dict(_tool_payload)
 
-        error = d.pop("error", UNSET)
+        _data = src_dict.get("data", UNSET)
+        data = UNSET if _data is UNSET else RunData.from_dict(_data)
 
-        step_results = []
-        _step_results = d.pop("stepResults", UNSET)
-        for step_results_item_data in _step_results or []:
-            step_results_item = RunStepResultsItem.from_dict(step_results_item_data)
+        error = src_dict.get("error", UNSET)
 
-            step_results.append(step_results_item)
+        _step_results = src_dict.get("stepResults")
+        step_results = list(map(RunStepResultsItem.from_dict, _step_results)) if _step_results else []
 
-        _options = d.pop("options", UNSET)
-        options: Union[Unset, RunOptions]
-        if isinstance(_options, Unset):
-            options = UNSET
-        else:
-            options = RunOptions.from_dict(_options)
+        _options = src_dict.get("options", UNSET)
+        options = UNSET if _options is UNSET else RunOptions.from_dict(_options)
 
-        request_source = d.pop("requestSource", UNSET)
+        request_source = src_dict.get("requestSource", UNSET)
 
-        trace_id = d.pop("traceId", UNSET)
+        trace_id = src_dict.get("traceId", UNSET)
 
         run = cls(
             run_id=run_id,
@@ -200,7 +148,8 @@ class Run:
             trace_id=trace_id,
         )
 
-        run.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            run.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return run
 
     @property
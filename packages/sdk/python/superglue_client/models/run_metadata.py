@@ -4,14 +4,16 @@ from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
+from .._datetime import parse_iso
 from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="RunMetadata")
 
+_KNOWN_KEYS = frozenset(("startedAt", "completedAt", "durationMs"))
 
-@_attrs_define
+
+@_attrs_define(slots=True, weakref_slot=False)
 class RunMetadata:
     """
     Attributes:
@@ -26,46 +28,25 @@ class RunMetadata:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        started_at: Union[Unset, str] = UNSET
-        if not isinstance(self.started_at, Unset):
-            started_at = self.started_at.isoformat()
-
-        completed_at: Union[Unset, str] = UNSET
-        if not isinstance(self.completed_at, Unset):
-            completed_at = self.completed_at.isoformat()
-
-        duration_ms = self.duration_ms
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if started_at is not UNSET:
-            field_dict["startedAt"] = started_at
-        if completed_at is not UNSET:
-            field_dict["completedAt"] = completed_at
-        if duration_ms is not UNSET:
-            field_dict["durationMs"] = duration_ms
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
+        if self.started_at is not UNSET:
+            field_dict["startedAt"] = self.started_at.isoformat()
+        if self.completed_at is not UNSET:
+            field_dict["completedAt"] = self.completed_at.isoformat()
+        if self.duration_ms is not UNSET:
+            field_dict["durationMs"] = self.duration_ms
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        _started_at = d.pop("startedAt", UNSET)
-        started_at: Union[Unset, datetime.datetime]
-        if isinstance(_started_at, Unset):
-            started_at = UNSET
-        else:
-            started_at = isoparse(_started_at)
-
-        _completed_at = d.pop("completedAt", UNSET)
-        completed_at: Union[Unset, datetime.datetime]
-        if isinstance(_completed_at, Unset):
-            completed_at = UNSET
-        else:
-            completed_at = isoparse(_completed_at)
-
-        duration_ms = d.pop("durationMs", UNSET)
+        _started_at = src_dict.get("startedAt", UNSET)
+        started_at = UNSET if _started_at is UNSET else parse_iso(_started_at)
+
+        _completed_at = src_dict.get("completedAt", UNSET)
+        completed_at = UNSET if _completed_at is UNSET else parse_iso(_completed_at)
+
+        duration_ms = src_dict.get("durationMs", UNSET)
 
         run_metadata = cls(
             started_at=started_at,
@@ -73,7 +54,8 @@ class RunMetadata:
             duration_ms=duration_ms,
         )
 
-        run_metadata.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            run_metadata.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return run_metadata
 
     @property
@@ -1,21 +1,20 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.run_request_credentials import RunRequestCredentials
+from ..models.run_request_inputs import RunRequestInputs
+from ..models.run_request_options import RunRequestOptions
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.run_request_credentials import RunRequestCredentials
-    from ..models.run_request_inputs import RunRequestInputs
-    from ..models.run_request_options import RunRequestOptions
-
-
 T = TypeVar("T", bound="RunRequest")
 
+_KNOWN_KEYS = frozenset(("runId", "inputs", "credentials", "options"))
+
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class RunRequest:
     """
     Attributes:
@@ -32,69 +31,36 @@ class RunRequest:
     """
 
     run_id: Union[Unset, str] = UNSET
-    inputs: Union[Unset, "RunRequestInputs"] = UNSET
-    credentials: Union[Unset, "RunRequestCredentials"] = UNSET
-    options: Union[Unset, "RunRequestOptions"] = UNSET
+    inputs: Union[Unset, RunRequestInputs] = UNSET
+    credentials: Union[Unset, RunRequestCredentials] = UNSET
+    options: Union[Unset, RunRequestOptions] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        run_id = self.run_id
-
-        inputs: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.inputs, Unset):
-            inputs = self.inputs.to_dict()
-
-        credentials: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.credentials, Unset):
-            credentials = self.credentials.to_dict()
-
-        options: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.options, Unset):
-            options = self.options.to_dict()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if run_id is not UNSET:
-            field_dict["runId"] = run_id
-        if inputs is not UNSET:
-            field_dict["inputs"] = inputs
-        if credentials is not UNSET:
-            field_dict["credentials"] = credentials
-        if options is not UNSET:
-            field_dict["options"] = options
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
+        if self.run_id is not UNSET:
+            field_dict["runId"] = self.run_id
+        if self.inputs is not UNSET:
+            field_dict["inputs"] = self.inputs.to_dict()
+        if self.credentials is not UNSET:
+            field_dict["credentials"] = self.credentials.to_dict()
+        if self.options is not UNSET:
+            field_dict["options"] = self.options.to_dict()
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.run_request_credentials import RunRequestCredentials
-        from ..models.run_request_inputs import RunRequestInputs
-        from ..models.run_request_options import RunRequestOptions
-
-        d = dict(src_dict)
-        run_id = d.pop("runId", UNSET)
-
-        _inputs = d.pop("inputs", UNSET)
-        inputs: Union[Unset, RunRequestInputs]
-        if isinstance(_inputs, Unset):
-            inputs = UNSET
-        else:
-            inputs = RunRequestInputs.from_dict(_inputs)
-
-        _credentials = d.pop("credentials", UNSET)
-        credentials: Union[Unset, RunRequestCredentials]
-        if isinstance(_credentials, Unset):
-            credentials = UNSET
-        else:
-            credentials = RunRequestCredentials.from_dict(_credentials)
-
-        _options = d.pop("options", UNSET)
-        options: Union[Unset, RunRequestOptions]
-        if isinstance(_options, Unset):
-            options = UNSET
-        else:
-            options = RunRequestOptions.from_dict(_options)
+        run_id = src_dict.get("runId", UNSET)
+
+        _inputs = src_dict.get("inputs", UNSET)
+        inputs = UNSET if _inputs is UNSET else RunRequestInputs.from_dict(_inputs)
+
+        _credentials = src_dict.get("credentials", UNSET)
+        credentials = UNSET if _credentials is UNSET else RunRequestCredentials.from_dict(_credentials)
+
+        _options = src_dict.get("options", UNSET)
+        options = UNSET if _options is UNSET else RunRequestOptions.from_dict(_options)
 
         run_request = cls(
             run_id=run_id,
@@ -103,7 +69,8 @@ class RunRequest:
             options=options,
         )
 
-        run_request.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            run_request.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return run_request
 
     @property
@@ -7,7 +7,7 @@ from attrs import field as _attrs_field
 T = TypeVar("T", bound="RunRequestCredentials")
 
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class RunRequestCredentials:
     """Runtime credentials for systems (overrides stored system credentials if provided).
     WARNING: These credentials are not persisted. Use systems for stored credentials.
@@ -20,17 +20,15 @@ class RunRequestCredentials:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
         run_request_credentials = cls()
 
-        run_request_credentials.additional_properties = d
+        run_request_credentials.additional_properties = dict(src_dict)
         return run_request_credentials
 
     @property
@@ -8,8 +8,10 @@ from ..types import UNSET, Unset
 
 T = TypeVar("T", bound="RunRequestOptions")
 
+_KNOWN_KEYS = frozenset(("async", "timeout", "webhookUrl", "traceId"))
 
-@_attrs_define
+
+@_attrs_define(slots=True, weakref_slot=False)
 class RunRequestOptions:
     """
     Attributes:
@@ -31,38 +33,27 @@ class RunRequestOptions:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        async_ = self.async_
-
-        timeout = self.timeout
-
-        webhook_url = self.webhook_url
-
-        trace_id = self.trace_id
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update({})
-        if async_ is not UNSET:
-            field_dict["async"] = async_
-        if timeout is not UNSET:
-            field_dict["timeout"] = timeout
-        if webhook_url is not UNSET:
-            field_dict["webhookUrl"] = webhook_url
-        if trace_id is not UNSET:
-            field_dict["traceId"] = trace_id
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
+        if self.async_ is not UNSET:
+            field_dict["async"] = self.async_
+        if self.timeout is not UNSET:
+            field_dict["timeout"] = self.timeout
+        if self.webhook_url is not UNSET:
+            field_dict["webhookUrl"] = self.webhook_url
+        if self.trace_id is not UNSET:
+            field_dict["traceId"] = self.trace_id
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        async_ = d.pop("async", UNSET)
+        async_ = src_dict.get("async", UNSET)
 
-        timeout = d.pop("timeout", UNSET)
+        timeout = src_dict.get("timeout", UNSET)
 
-        webhook_url = d.pop("webhookUrl", UNSET)
+        webhook_url = src_dict.get("webhookUrl", UNSET)
 
-        trace_id = d.pop("traceId", UNSET)
+        trace_id = src_dict.get("traceId", UNSET)
 
         run_request_options = cls(
             async_=async_,
@@ -71,7 +62,8 @@ class RunRequestOptions:
             trace_id=trace_id,
         )
 
-        run_request_options.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            run_request_options.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return run_request_options
 
     @property
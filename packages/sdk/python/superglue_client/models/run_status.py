@@ -1,11 +1,19 @@
-from enum import Enum
+from typing import Optional
 
+from ..types import StrEnum
 
-class RunStatus(str, Enum):
+
+class RunStatus(StrEnum):
     ABORTED = "aborted"
     FAILED = "failed"
     RUNNING = "running"
     SUCCESS = "success"
 
-    def __str__(self) -> str:
-        return str(self.value)
+    @classmethod
+    def try_parse(cls, value: str) -> Optional["RunStatus"]:
+        """Return the member with the given value, or None if there is none"""
+        return BY_VALUE.get(value) if isinstance(value, str) else None
+
+
+# Members keyed by value, so parsing is a dict lookup rather than a call through the enum metaclass
+BY_VALUE: dict[str, RunStatus] = {member.value: member for member in RunStatus}
@@ -1,19 +1,18 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.run_step_results_item_data import RunStepResultsItemData
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.run_step_results_item_data import RunStepResultsItemData
-
-
 T = TypeVar("T", bound="RunStepResultsItem")
 
+_KNOWN_KEYS = frozenset(("stepId", "success", "data", "error"))
+
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class RunStepResultsItem:
     """
     Attributes:
@@ -25,53 +24,33 @@ class RunStepResultsItem:
 
     step_id: str
     success: bool
-    data: Union[Unset, "RunStepResultsItemData"] = UNSET
+    data: Union[Unset, RunStepResultsItemData] = UNSET
     error: Union[Unset, str] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        step_id = self.step_id
-
-        success = self.success
-
-        data: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.data, Unset):
-            data = self.data.to_dict()
-
-        error = self.error
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "stepId": step_id,
-                "success": success,
-            }
-        )
-        if data is not UNSET:
-            field_dict["data"] = data
-        if error is not UNSET:
-            field_dict["error"] = error
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "stepId": self.step_id,
+            "success": self.success,
+        }
+        if self.data is not UNSET:
+            field_dict["data"] = self.data.to_dict()
+        if self.error is not UNSET:
+            field_dict["error"] = self.error
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.run_step_results_item_data import RunStepResultsItemData
-
-        d = dict(src_dict)
-        step_id = d.pop("stepId")
+        step_id = src_dict["stepId"]
 
-        success = d.pop("success")
+        success = src_dict["success"]
 
-        _data = d.pop("data", UNSET)
-        data: Union[Unset, RunStepResultsItemData]
-        if isinstance(_data, Unset):
-            data = UNSET
-        else:
-            data = RunStepResultsItemData.from_dict(_data)
+        _data = src_dict.get("data", UNSET)
+        data = UNSET if _data is UNSET else RunStepResultsItemData.from_dict(_data)
 
-        error = d.pop("error", UNSET)
+        error = src_dict.get("error", UNSET)
 
         run_step_results_item = cls(
             step_id=step_id,
@@ -80,7 +59,8 @@ class RunStepResultsItem:
             error=error,
         )
 
-        run_step_results_item.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            run_step_results_item.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return run_step_results_item
 
     @property
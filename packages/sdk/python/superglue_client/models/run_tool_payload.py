@@ -7,24 +7,22 @@ from attrs import field as _attrs_field
 T = TypeVar("T", bound="RunToolPayload")
 
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class RunToolPayload:
     """The inputs and options provided when running the tool"""
 
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
         run_tool_payload = cls()
 
-        run_tool_payload.additional_properties = d
+        run_tool_payload.additional_properties = dict(src_dict)
         return run_tool_payload
 
     @property
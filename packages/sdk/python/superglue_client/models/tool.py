@@ -1,24 +1,39 @@
 import datetime
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
-from dateutil.parser import isoparse
 
+from .._datetime import parse_iso
+from ..models.response_filter import ResponseFilter
+from ..models.tool_input_schema import ToolInputSchema
+from ..models.tool_output_schema import ToolOutputSchema
+from ..models.tool_step import ToolStep
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.response_filter import ResponseFilter
-    from ..models.tool_input_schema import ToolInputSchema
-    from ..models.tool_output_schema import ToolOutputSchema
-    from ..models.tool_step import ToolStep
-
-
 T = TypeVar("T", bound="Tool")
 
-
-@_attrs_define
+_KNOWN_KEYS = frozenset(
+    (
+        "id",
+        "steps",
+        "name",
+        "version",
+        "instruction",
+        "inputSchema",
+        "outputSchema",
+        "outputTransform",
+        "folder",
+        "archived",
+        "responseFilters",
+        "createdAt",
+        "updatedAt",
+    )
+)
+
+
+@_attrs_define(slots=True, weakref_slot=False)
 class Tool:
     """A multi-step workflow tool that executes one or more protocol-specific operations
 
@@ -45,159 +60,85 @@ class Tool:
     """
 
     id: str
-    steps: list["ToolStep"]
+    steps: list[ToolStep]
     name: Union[Unset, str] = UNSET
     version: Union[Unset, str] = UNSET
     instruction: Union[Unset, str] = UNSET
-    input_schema: Union[Unset, "ToolInputSchema"] = UNSET
-    output_schema: Union[Unset, "ToolOutputSchema"] = UNSET
+    input_schema: Union[Unset, ToolInputSchema] = UNSET
+    output_schema: Union[Unset, ToolOutputSchema] = UNSET
     output_transform: Union[Unset, str] = UNSET
     folder: Union[Unset, str] = UNSET
     archived: Union[Unset, bool] = False
-    response_filters: Union[Unset, list["ResponseFilter"]] = UNSET
+    response_filters: Union[Unset, list[ResponseFilter]] = UNSET
     created_at: Union[Unset, datetime.datetime] = UNSET
     updated_at: Union[Unset, datetime.datetime] = UNSET
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        id = self.id
-
-        steps = []
-        for steps_item_data in self.steps:
-            steps_item = steps_item_data.to_dict()
-            steps.append(steps_item)
-
-        name = self.name
-
-        version = self.version
-
-        instruction = self.instruction
-
-        input_schema: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.input_schema, Unset):
-            input_schema = self.input_schema.to_dict()
-
-        output_schema: Union[Unset, dict[str, Any]] = UNSET
-        if not isinstance(self.output_schema, Unset):
-            output_schema = self.output_schema.to_dict()
-
-        output_transform = self.output_transform
-
-        folder = self.folder
-
-        archived = self.archived
-
-        response_filters: Union[Unset, list[dict[str, Any]]] = UNSET
-        if not isinstance(self.response_filters, Unset):
-            response_filters = []
-            for response_filters_item_data in self.response_filters:
-                response_filters_item = response_filters_item_data.to_dict()
-                response_filters.append(response_filters_item)
-
-        created_at: Union[Unset, str] = UNSET
-        if not isinstance(self.created_at, Unset):
-            created_at = self.created_at.isoformat()
-
-        updated_at: Union[Unset, str] = UNSET
-        if not isinstance(self.updated_at, Unset):
-            updated_at = self.updated_at.isoformat()
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "steps": steps,
-            }
-        )
-        if name is not UNSET:
-            field_dict["name"] = name
-        if version is not UNSET:
-            field_dict["version"] = version
-        if instruction is not UNSET:
-            field_dict["instruction"] = instruction
-        if input_schema is not UNSET:
-            field_dict["inputSchema"] = input_schema
-        if output_schema is not UNSET:
-            field_dict["outputSchema"] = output_schema
-        if output_transform is not UNSET:
-            field_dict["outputTransform"] = output_transform
-        if folder is not UNSET:
-            field_dict["folder"] = folder
-        if archived is not UNSET:
-            field_dict["archived"] = archived
-        if response_filters is not UNSET:
-            field_dict["responseFilters"] = response_filters
-        if created_at is not UNSET:
-            field_dict["createdAt"] = created_at
-        if updated_at is not UNSET:
-            field_dict["updatedAt"] = updated_at
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "id": self.id,
+            "steps": [steps_item.to_dict() for steps_item in self.steps],
+        }
+        if self.name is not UNSET:
+            field_dict["name"] = self.name
+        if self.version is not UNSET:
+            field_dict["version"] = self.version
+        if self.instruction is not UNSET:
+            field_dict["instruction"] = self.instruction
+        if self.input_schema is not UNSET:
+            field_dict["inputSchema"] = self.input_schema.to_dict()
+        if self.output_schema is not UNSET:
+            field_dict["outputSchema"] = self.output_schema.to_dict()
+        if self.output_transform is not UNSET:
+            field_dict["outputTransform"] = self.output_transform
+        if self.folder is not UNSET:
+            field_dict["folder"] = self.folder
+        if self.archived is not UNSET:
+            field_dict["archived"] = self.archived
+        if self.response_filters is not UNSET:
+            field_dict["responseFilters"] = [
+                response_filters_item.to_dict() for response_filters_item in self.response_filters
+            ]
+        if self.created_at is not UNSET:
+            field_dict["createdAt"] = self.created_at.isoformat()
+        if self.updated_at is not UNSET:
+            field_dict["updatedAt"] = self.updated_at.isoformat()
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.response_filter import ResponseFilter
-        from ..models.tool_input_schema import ToolInputSchema
-        from ..models.tool_output_schema import ToolOutputSchema
-        from ..models.tool_step import ToolStep
-
-        d = dict(src_dict)
-        id = d.pop("id")
-
-        steps = []
-        _steps = d.pop("steps")
-        for steps_item_data in _steps:
-            steps_item = ToolStep.from_dict(steps_item_data)
-
-            steps.append(steps_item)
+        id = src_dict["id"]
 
-        name = d.pop("name", UNSET)
+        steps = list(map(ToolStep.from_dict, src_dict["steps"]))
 
-        version = d.pop("version", UNSET)
+        name = src_dict.get("name", UNSET)
 
-        instruction = d.pop("instruction", UNSET)
+        version = src_dict.get("version", UNSET)
 
-        _input_schema = d.pop("inputSchema", UNSET)
-        input_schema: Union[Unset, ToolInputSchema]
-        if isinstance(_input_schema, Unset):
-            input_schema = UNSET
-        else:
-            input_schema = ToolInputSchema.from_dict(_input_schema)
+        instruction = src_dict.get("instruction", UNSET)
 
-        _output_schema = d.pop("outputSchema", UNSET)
-        output_schema: Union[Unset, ToolOutputSchema]
-        if isinstance(_output_schema, Unset):
-            output_schema = UNSET
-        else:
-            output_schema = ToolOutputSchema.from_dict(_output_schema)
+        _input_schema = src_dict.get("inputSchema", UNSET)
+        input_schema = UNSET if _input_schema is UNSET else ToolInputSchema.from_dict(_input_schema)
 
-        output_transform = d.pop("outputTransform", UNSET)
+        _output_schema = src_dict.get("outputSchema", UNSET)
+        output_schema = UNSET if _output_schema is UNSET else ToolOutputSchema.from_dict(_output_schema)
 
-        folder = d.pop("folder", UNSET)
+        output_transform = src_dict.get("outputTransform", UNSET)
 
-        archived = d.pop("archived", UNSET)
+        folder = src_dict.get("folder", UNSET)
 
-        response_filters = []
-        _response_filters = d.pop("responseFilters", UNSET)
-        for response_filters_item_data in _response_filters or []:
-            response_filters_item = ResponseFilter.from_dict(response_filters_item_data)
+        archived = src_dict.get("archived", UNSET)
 
-            response_filters.append(response_filters_item)
+        _response_filters = src_dict.get("responseFilters")
+        response_filters = list(map(ResponseFilter.from_dict, _response_filters)) if _response_filters else []
 
-        _created_at = d.pop("createdAt", UNSET)
-        created_at: Union[Unset, datetime.datetime]
-        if isinstance(_created_at, Unset):
-            created_at = UNSET
-        else:
-            created_at = isoparse(_created_at)
+        _created_at = src_dict.get("createdAt", UNSET)
+        created_at = UNSET if _created_at is UNSET else parse_iso(_created_at)
 
-        _updated_at = d.pop("updatedAt", UNSET)
-        updated_at: Union[Unset, datetime.datetime]
-        if isinstance(_updated_at, Unset):
-            updated_at = UNSET
-        else:
-            updated_at = isoparse(_updated_at)
+        _updated_at = src_dict.get("updatedAt", UNSET)
+        updated_at = UNSET if _updated_at is UNSET else parse_iso(_updated_at)
 
         tool = cls(
             id=id,
@@ -215,7 +156,8 @@ class Tool:
             updated_at=updated_at,
         )
 
-        tool.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            tool.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return tool
 
     @property
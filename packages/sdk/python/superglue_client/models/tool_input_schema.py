@@ -7,7 +7,7 @@ from attrs import field as _attrs_field
 T = TypeVar("T", bound="ToolInputSchema")
 
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class ToolInputSchema:
     """JSON Schema for tool inputs
 
@@ -20,17 +20,15 @@ class ToolInputSchema:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
         tool_input_schema = cls()
 
-        tool_input_schema.additional_properties = d
+        tool_input_schema.additional_properties = dict(src_dict)
         return tool_input_schema
 
     @property
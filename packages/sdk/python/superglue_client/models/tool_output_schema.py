@@ -7,24 +7,22 @@ from attrs import field as _attrs_field
 T = TypeVar("T", bound="ToolOutputSchema")
 
 
-@_attrs_define
+@_attrs_define(slots=True, weakref_slot=False)
 class ToolOutputSchema:
     """JSON Schema for tool outputs (after transformations applied)"""
 
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
+        field_dict: dict[str, Any] = dict(self.additional_properties) if self.additional_properties else {}
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
         tool_output_schema = cls()
 
-        tool_output_schema.additional_properties = d
+        tool_output_schema.additional_properties = dict(src_dict)
         return tool_output_schema
 
     @property
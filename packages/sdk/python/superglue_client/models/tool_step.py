@@ -1,21 +1,21 @@
 from collections.abc import Mapping
-from typing import TYPE_CHECKING, Any, TypeVar, Union
+from typing import Any, TypeVar, Union
 
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.request_step_config import RequestStepConfig
+from ..models.tool_step_failure_behavior import BY_VALUE as FAILURE_BEHAVIOR_BY_VALUE
 from ..models.tool_step_failure_behavior import ToolStepFailureBehavior
+from ..models.transform_step_config import TransformStepConfig
 from ..types import UNSET, Unset
 
-if TYPE_CHECKING:
-    from ..models.request_step_config import RequestStepConfig
-    from ..models.transform_step_config import TransformStepConfig
-
-
 T = TypeVar("T", bound="ToolStep")
 
+_KNOWN_KEYS = frozenset(("id", "config", "instruction", "modify", "dataSelector", "failureBehavior"))
 
-@_attrs_define
+
+@_attrs_define(slots=True, weakref_slot=False)
 class ToolStep:
     """A single execution step containing either a request configuration (API call)
     or a transform configuration (data transformation).
@@ -34,7 +34,7 @@ class ToolStep:
     """
 
     id: str
-    config: Union["RequestStepConfig", "TransformStepConfig"]
+    config: Union[RequestStepConfig, TransformStepConfig]
     instruction: Union[Unset, str] = UNSET
     modify: Union[Unset, bool] = False
     data_selector: Union[Unset, str] = UNSET
@@ -42,82 +42,48 @@ class ToolStep:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        from ..models.request_step_config import RequestStepConfig
-
-        id = self.id
-
-        config: dict[str, Any]
-        if isinstance(self.config, RequestStepConfig):
-            config = self.config.to_dict()
-        else:
-            config = self.config.to_dict()
-
-        instruction = self.instruction
-
-        modify = self.modify
-
-        data_selector = self.data_selector
-
-        failure_behavior: Union[Unset, str] = UNSET
-        if not isinstance(self.failure_behavior, Unset):
-            failure_behavior = self.failure_behavior.value
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "id": id,
-                "config": config,
-            }
-        )
-        if instruction is not UNSET:
-            field_dict["instruction"] = instruction
-        if modify is not UNSET:
-            field_dict["modify"] = modify
-        if data_selector is not UNSET:
-            field_dict["dataSelector"] = data_selector
-        if failure_behavior is not UNSET:
-            field_dict["failureBehavior"] = failure_behavior
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "id": self.id,
+            "config": self.config.to_dict(),
+        }
+        if self.instruction is not UNSET:
+            field_dict["instruction"] = self.instruction
+        if self.modify is not UNSET:
+            field_dict["modify"] = self.modify
+        if self.data_selector is not UNSET:
+            field_dict["dataSelector"] = self.data_selector
+        if self.failure_behavior is not UNSET:
+            field_dict["failureBehavior"] = self.failure_behavior._value_
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        from ..models.request_step_config import RequestStepConfig
-        from ..models.transform_step_config import TransformStepConfig
-
-        d = dict(src_dict)
-        id = d.pop("id")
+        id = src_dict["id"]
 
-        def _parse_config(data: object) -> Union["RequestStepConfig", "TransformStepConfig"]:
-            try:
-                if not isinstance(data, dict):
-                    raise TypeError()
-                componentsschemas_step_config_type_0 = RequestStepConfig.from_dict(data)
+        _config = src_dict["config"]
+        if not isinstance(_config, dict):
+            raise TypeError()
+        config: Union[RequestStepConfig, TransformStepConfig]
+        try:
+            config = RequestStepConfig.from_dict(_config)
+        except:  # noqa: E722
+            config = TransformStepConfig.from_dict(_config)
 
-                return componentsschemas_step_config_type_0
-            except:  # noqa: E722
-                pass
-            if not isinstance(data, dict):
-                raise TypeError()
-            componentsschemas_step_config_type_1 = TransformStepConfig.from_dict(data)
+        instruction = src_dict.get("instruction", UNSET)
 
-            return componentsschemas_step_config_type_1
+        modify = src_dict.get("modify", UNSET)
 
-        config = _parse_config(d.pop("config"))
+        data_selector = src_dict.get("dataSelector", UNSET)
 
-        instruction = d.pop("instruction", UNSET)
-
-        modify = d.pop("modify", UNSET)
-
-        data_selector = d.pop("dataSelector", UNSET)
-
-        _failure_behavior = d.pop("failureBehavior", UNSET)
-        failure_behavior: Union[Unset, ToolStepFailureBehavior]
-        if isinstance(_failure_behavior, Unset):
-            failure_behavior = UNSET
-        else:
-            failure_behavior = ToolStepFailureBehavior(_failure_behavior)
+        _failure_behavior = src_dict.get("failureBehavior", UNSET)
+        failure_behavior = (
+            UNSET
+            if _failure_behavior is UNSET
+            else (isinstance(_failure_behavior, str) and FAILURE_BEHAVIOR_BY_VALUE.get(_failure_behavior))
+            or ToolStepFailureBehavior(_failure_behavior)
+        )
 
         tool_step = cls(
             id=id,
@@ -128,7 +94,8 @@ class ToolStep:
             failure_behavior=failure_behavior,
         )
 
-        tool_step.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            tool_step.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return tool_step
 
     @property
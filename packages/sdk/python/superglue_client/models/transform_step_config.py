@@ -4,12 +4,15 @@ from typing import Any, TypeVar
 from attrs import define as _attrs_define
 from attrs import field as _attrs_field
 
+from ..models.transform_step_config_type import BY_VALUE as TYPE_BY_VALUE
 from ..models.transform_step_config_type import TransformStepConfigType
 
 T = TypeVar("T", bound="TransformStepConfig")
 
+_KNOWN_KEYS = frozenset(("type", "transformCode"))
 
-@_attrs_define
+
+@_attrs_define(slots=True, weakref_slot=False)
 class TransformStepConfig:
     """Configuration for a transform step. Transform steps execute JavaScript code
     to reshape data between request steps without making external API calls.
@@ -27,34 +30,28 @@ class TransformStepConfig:
     additional_properties: dict[str, Any] = _attrs_field(init=False, factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
-        type_ = self.type_.value
-
-        transform_code = self.transform_code
-
-        field_dict: dict[str, Any] = {}
-        field_dict.update(self.additional_properties)
-        field_dict.update(
-            {
-                "type": type_,
-                "transformCode": transform_code,
-            }
-        )
+        field_dict: dict[str, Any] = {
+            **self.additional_properties,
+            "type": self.type_._value_,
+            "transformCode": self.transform_code,
+        }
 
         return field_dict
 
     @classmethod
     def from_dict(cls: type[T], src_dict: Mapping[str, Any]) -> T:
-        d = dict(src_dict)
-        type_ = TransformStepConfigType(d.pop("type"))
+        _type_ = src_dict["type"]
+        type_ = (isinstance(_type_, str) and TYPE_BY_VALUE.get(_type_)) or TransformStepConfigType(_type_)
 
-        transform_code = d.pop("transformCode")
+        transform_code = src_dict["transformCode"]
 
         transform_step_config = cls(
             type_=type_,
             transform_code=transform_code,
         )
 
-        transform_step_config.additional_properties = d
+        if not _KNOWN_KEYS.issuperset(src_dict):
+            transform_step_config.additional_properties = {k: v for k, v in src_dict.items() if k not in _KNOWN_KEYS}
         return transform_step_config
 
     @property
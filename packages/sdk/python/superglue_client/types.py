@@ -1,6 +1,8 @@
 """Contains some shared types for properties"""
 
+import sys
 from collections.abc import Mapping, MutableMapping
+from enum import Enum
 from http import HTTPStatus
 from typing import IO, BinaryIO, Generic, Literal, Optional, TypeVar, Union
 
@@ -14,6 +16,17 @@ class Unset:
 
 UNSET: Unset = Unset()
 
+if sys.version_info >= (3, 11):
+    from enum import StrEnum
+else:
+
+    class StrEnum(str, Enum):
+        """Backport of enum.StrEnum: members are strings whose str() and format() are the value"""
+
+        __str__ = str.__str__
+        __format__ = str.__format__
+
+
 # The types that `httpx.Client(files=)` can accept, copied from that library.
 FileContent = Union[IO[bytes], bytes, str]
 FileTypes = Union[
@@ -51,4 +64,4 @@ class Response(Generic[T]):
     parsed: Optional[T]
 
 
-__all__ = ["UNSET", "File", "FileTypes", "RequestFiles", "Response", "Unset"]
+__all__ = ["UNSET", "File", "FileTypes", "RequestFiles", "Response", "StrEnum", "Unset"]
@@ -0,0 +1,11 @@
+from superglue_client import Client
+
+
+def test_closing_a_derived_client_leaves_the_parent_open() -> None:
+    parent = Client(base_url="https://api.example.com")
+    parent.get_httpx_client()
+
+    with parent.with_headers({"X-Trace": "1"}):
+        pass
+
+    assert not parent.get_httpx_client().is_closed
@@ -0,0 +1,19 @@
+import datetime
+import math
+
+import pytest
+
+from superglue_client import _json
+
+
+def test_dumps_encodes_compact_utf8() -> None:
+    assert _json.dumps({"name": "café", "n": [1, 2**70]}) == '{"name":"café","n":[1,1180591620717411303424]}'.encode()
+
+
+def test_dumps_writes_non_finite_floats_like_json_dumps() -> None:
+    assert _json.dumps([math.nan, math.inf, -math.inf]) == b"[NaN,Infinity,-Infinity]"
+
+
+def test_dumps_rejects_values_json_cannot_represent() -> None:
+    with pytest.raises(TypeError):
+        _json.dumps({"value": datetime.datetime(2024, 1, 1)})
@@ -0,0 +1,180 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from superglue_client import Client
+from superglue_client.api.tools import list_tools
+
+
+def _tool(index: int) -> dict:
+    return {"id": f"tool-{index}", "steps": []}
+
+
+def _paged_transport(total: int, max_page_size: int, echo_limit: bool = True) -> httpx.MockTransport:
+    """A server holding ``total`` tools that never returns more than ``max_page_size`` of them per page"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        limit = min(int(request.url.params.get("limit", 50)), max_page_size)
+        start = (page - 1) * limit
+        body = {
+            "data": [_tool(i) for i in range(start, min(start + limit, total))],
+            "page": page,
+            "total": total,
+            "hasMore": start + limit < total,
+        }
+        if echo_limit:
+            body["limit"] = limit
+        return httpx.Response(200, content=json.dumps(body).encode())
+
+    return httpx.MockTransport(handler)
+
+
+def _client(transport: httpx.MockTransport) -> Client:
+    return Client(base_url="https://api.example.com", httpx_args={"transport": transport})
+
+
+@pytest.mark.parametrize("echo_limit", [True, False])
+def test_asyncio_all_returns_every_tool_when_the_server_clamps_the_page_size(echo_limit: bool) -> None:
+    client = _client(_paged_transport(total=5, max_page_size=2, echo_limit=echo_limit))
+
+    tools = asyncio.run(list_tools.asyncio_all(client=client, limit=10))
+
+    assert [tool.id for tool in tools] == [f"tool-{i}" for i in range(5)]
+
+
+def test_asyncio_all_caps_concurrent_requests() -> None:
+    in_flight = 0
+    peak = 0
+    inner = _paged_transport(total=40, max_page_size=2)
+
+    class CountingTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await inner.handle_async_request(request)
+
+    client = Client(base_url="https://api.example.com", httpx_args={"transport": CountingTransport()})
+
+    tools = asyncio.run(list_tools.asyncio_all(client=client, limit=2, max_concurrency=3))
+
+    assert len(tools) == 40
+    assert peak == 3
+
+
+@pytest.mark.parametrize("kwargs", [{"limit": 0}, {"max_concurrency": 0}])
+def test_asyncio_all_rejects_values_below_one(kwargs: dict) -> None:
+    client = _client(_paged_transport(total=5, max_page_size=2))
+
+    with pytest.raises(ValueError):
+        asyncio.run(list_tools.asyncio_all(client=client, **kwargs))
+
+
+def test_not_modified_pages_are_parsed_fresh_for_every_caller() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        body = {"data": [_tool(0)], "page": 1, "limit": 50, "total": 1, "hasMore": False}
+        return httpx.Response(200, headers={"ETag": '"v1"'}, content=json.dumps(body).encode())
+
+    client = _client(httpx.MockTransport(handler))
+
+    first = list_tools.sync_detailed(client=client)
+    first.parsed.data.append("junk")
+    second = list_tools.sync_detailed(client=client)
+    second.parsed.data.clear()
+    third = list_tools.sync_detailed(client=client)
+
+    assert second.status_code == 304
+    assert third.status_code == 304
+    assert third.parsed is not second.parsed
+    assert [tool.id for tool in third.parsed.data] == ["tool-0"]
+
+
+def test_asyncio_detailed_does_not_share_requests_across_event_loops() -> None:
+    requests = 0
+    inner = _paged_transport(total=3, max_page_size=50)
+
+    class FirstRequestHangsTransport(httpx.AsyncBaseTransport):
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            nonlocal requests
+            requests += 1
+            if requests == 1:
+                await asyncio.Event().wait()
+            return await inner.handle_async_request(request)
+
+    client = _client(FirstRequestHangsTransport())
+    stale_loop = asyncio.new_event_loop()
+    stale_loop.create_task(list_tools.asyncio_detailed(client=client))
+    stale_loop.run_until_complete(asyncio.sleep(0.01))
+
+    try:
+        response = asyncio.run(list_tools.asyncio_detailed(client=client))
+    finally:
+        pending = asyncio.all_tasks(stale_loop)
+        for task in pending:
+            task.cancel()
+        stale_loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        stale_loop.close()
+
+    assert requests == 2
+    assert response.parsed is not None
+    assert len(response.parsed.data) == 3
+
+
+def test_sync_iter_does_not_fill_the_etag_cache() -> None:
+    inner = _paged_transport(total=10, max_page_size=2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = inner.handle_request(request)
+        response.headers["ETag"] = f'"page-{request.url.params["page"]}"'
+        return response
+
+    client = _client(httpx.MockTransport(handler))
+
+    tools = list(list_tools.sync_iter(client=client, limit=2))
+
+    assert len(tools) == 10
+    assert not list_tools._etags.get(client.get_httpx_client())
+
+
+def test_asyncio_all_does_not_fill_the_etag_cache() -> None:
+    inner = _paged_transport(total=10, max_page_size=2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = inner.handle_request(request)
+        response.headers["ETag"] = f'"page-{request.url.params["page"]}"'
+        return response
+
+    client = _client(httpx.MockTransport(handler))
+
+    tools = asyncio.run(list_tools.asyncio_all(client=client, limit=2))
+
+    assert len(tools) == 10
+    assert not list_tools._etags.get(client.get_async_httpx_client())
+
+
+def test_etag_cache_keeps_only_the_most_recently_used_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(list_tools, "_ETAG_CACHE_SIZE", 2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = request.url.params["page"]
+        if request.headers.get("If-None-Match") == f'"page-{page}"':
+            return httpx.Response(304)
+        body = {"data": [], "page": int(page), "limit": 50, "total": 0, "hasMore": False}
+        return httpx.Response(200, headers={"ETag": f'"page-{page}"'}, content=json.dumps(body).encode())
+
+    client = _client(httpx.MockTransport(handler))
+    list_tools.sync_detailed(client=client, page=1)
+    list_tools.sync_detailed(client=client, page=2)
+    # A 304 for page 1 marks it as recently used, so page 2 is the one evicted for page 3
+    assert list_tools.sync_detailed(client=client, page=1).status_code == 304
+    list_tools.sync_detailed(client=client, page=3)
+
+    cached_pages = list_tools._etags[client.get_httpx_client()]
+    assert [dict(key[1])["page"] for key in cached_pages] == [1, 3]
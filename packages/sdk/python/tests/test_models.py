@@ -0,0 +1,24 @@
+import pytest
+
+from superglue_client.models import Pagination, PaginationType, Run, RunStatus, ToolStep
+
+
+def test_enum_fields_parse_from_their_value() -> None:
+    assert Pagination.from_dict({"type": "pageBased"}).type_ is PaginationType.PAGEBASED
+
+
+@pytest.mark.parametrize("value", ["unknown", ["pageBased"], {"type": "pageBased"}, None])
+def test_invalid_enum_values_raise_value_error(value: object) -> None:
+    with pytest.raises(ValueError):
+        Pagination.from_dict({"type": value})
+    with pytest.raises(ValueError):
+        Run.from_dict({"runId": "r", "toolId": "t", "status": value, "metadata": {}})
+    with pytest.raises(ValueError):
+        ToolStep.from_dict(
+            {"id": "s", "config": {"url": "https://example.com", "method": "GET"}, "failureBehavior": value}
+        )
+
+
+@pytest.mark.parametrize("value", ["unknown", ["success"], None])
+def test_run_status_try_parse_returns_none_for_invalid_values(value: object) -> None:
+    assert RunStatus.try_parse(value) is None
@@ -12,6 +12,9 @@ ROOT_DIR="$(dirname "$(dirname "$SDK_DIR")")"
 OPENAPI_SPEC="$ROOT_DIR/docs/openapi.yaml"
 OUTPUT_DIR="$SDK_DIR/python/superglue_client"
 VENV_DIR="$ROOT_DIR/.venv-sdk-gen"
+TEMPLATES_DIR="$SCRIPT_DIR/python-sdk-templates"
+# The custom templates extend the built-in ones, so they are tied to this generator version
+GENERATOR_VERSION="0.26.2"
 
 echo "🐍 Generating Python SDK from OpenAPI spec..."
 echo "  Input: $OPENAPI_SPEC"
@@ -26,9 +29,9 @@ fi
 source "$VENV_DIR/bin/activate"
 
 # Install openapi-python-client if needed
-if ! pip show openapi-python-client &> /dev/null; then
-    echo "📦 Installing openapi-python-client..."
-    pip install --quiet openapi-python-client
+if [ "$(pip show openapi-python-client 2> /dev/null | sed -n 's/^Version: //p')" != "$GENERATOR_VERSION" ]; then
+    echo "📦 Installing openapi-python-client $GENERATOR_VERSION..."
+    pip install --quiet "openapi-python-client==$GENERATOR_VERSION"
 fi
 
 # Backup pyproject.toml and README
@@ -41,8 +44,9 @@ if [ -f "$OUTPUT_DIR/README.md" ]; then
     README_BACKUP=$(cat "$OUTPUT_DIR/README.md")
 fi
 
-# Remove old generated code (keep pyproject.toml and README)
-find "$OUTPUT_DIR" -mindepth 1 -maxdepth 1 ! -name 'pyproject.toml' ! -name 'README.md' ! -name 'LICENSE' -exec rm -rf {} +
+# Remove old generated code (keep pyproject.toml, README and the hand-written _json.py and _datetime.py modules)
+find "$OUTPUT_DIR" -mindepth 1 -maxdepth 1 ! -name 'pyproject.toml' ! -name 'README.md' ! -name 'LICENSE' \
+    ! -name '_json.py' ! -name '_datetime.py' -exec rm -rf {} +
 
 # Generate the SDK to a temp directory
 TEMP_DIR=$(mktemp -d)
@@ -51,6 +55,7 @@ openapi-python-client generate \
     --path "$OPENAPI_SPEC" \
     --output-path "$TEMP_DIR/superglue_client" \
     --config "$SCRIPT_DIR/python-sdk-config.yaml" \
+    --custom-template-path "$TEMPLATES_DIR" \
     --meta poetry
 
 # Copy generated source files to output (flatten structure)
@@ -67,16 +72,6 @@ fi
 # Clean up temp
 rm -rf "$TEMP_DIR"
 
-# Add SuperglueClient alias for better DX
-INIT_FILE="$OUTPUT_DIR/__init__.py"
-if [ -f "$INIT_FILE" ]; then
-    # Add alias if not already present
-    if ! grep -q "SuperglueClient" "$INIT_FILE"; then
-        sed -i '' 's/from .client import AuthenticatedClient, Client/from .client import AuthenticatedClient, Client\n\n# Alias for better DX\nSuperglueClient = AuthenticatedClient/' "$INIT_FILE"
-        sed -i '' 's/__all__ = (/__all__ = (\n    "SuperglueClient",/' "$INIT_FILE"
-    fi
-fi
-
 deactivate
 
 echo "✅ Python SDK generated successfully!"